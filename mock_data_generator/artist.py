@@ -1,21 +1,35 @@
 """Contains the PlotArtist class which can be used to generate mock timeseries data for testing."""
 
 import os
-import time
-from collections import namedtuple
 from pathlib import Path
 from typing import Any, Optional
 
 import matplotlib.dates as mdates
 import matplotlib.patches as mpatches
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from matplotlib.artist import Artist
+from matplotlib.backend_bases import MouseButton
+from matplotlib.lines import Line2D
 
 import mock_data_generator.reshaper as reshaper
 from mock_data_generator.util import ask_user, get_response
 
-# A nice way to represent a point with x and y coordinates
-Point = namedtuple("Point", ["x", "y"])
+# Durations used when building the allowed x coordinates and formatting the x axis
+_ONE_SEC = pd.Timedelta("1s")
+_ONE_MIN = pd.Timedelta("1min")
+_ONE_HOUR = pd.Timedelta("1h")
+_ONE_DAY = pd.Timedelta("1D")
+
+# Tick label formats for the x axis, keyed by (length of the time range, granularity of the period)
+_DATE_FMTS = {"months": "%m-%d ", "days": "-%d ", "hours": ""}
+_TIME_FMTS = {"seconds": "%H:%M:%S", "minutes": "%H:%M", "hours": "%H"}
+_FMT_TABLE = {
+    (range_bucket, period_bucket): date_fmt + time_fmt
+    for range_bucket, date_fmt in _DATE_FMTS.items()
+    for period_bucket, time_fmt in _TIME_FMTS.items()
+}
 
 
 class PlotArtist:
@@ -52,9 +66,23 @@ class PlotArtist:
         self.tz = self.start.tzinfo
         self.time_col = time_col
 
-        # Allowed x coordinates
+        # Allowed x coordinates, built as a regular grid of nanoseconds (also used to snap clicks with
+        # integer arithmetic) which matches pd.date_range(start, end - _ONE_SEC, freq=period).
+        # Like date_range, whole-day periods step in calendar days, so in a timezone their grid is
+        # regular in local wall-clock time rather than in UTC (days can be 23 or 25 hours long).
         self.period = period
-        self.allowed_x = pd.date_range(start, end - pd.Timedelta("1s"), freq=period)
+        self._period_ns = self.period.value
+        self._wall_clock_grid = self.tz is not None and self.period % _ONE_DAY == pd.Timedelta(0)
+        self._allowed_i8 = np.arange(
+            self._grid_ns(start), self._grid_ns(end - _ONE_SEC) + 1, self._period_ns, dtype=np.int64
+        )
+        allowed_x = pd.DatetimeIndex(self._allowed_i8.view("M8[ns]"))
+        if self._wall_clock_grid:
+            self.allowed_x = allowed_x.tz_localize(self.tz)
+        elif self.tz:
+            self.allowed_x = allowed_x.tz_localize("UTC").tz_convert(self.tz)
+        else:
+            self.allowed_x = allowed_x
 
         # How much extra space to add to the left and right of the start and end on the plot
         self.x_buffer = self.period / 3
@@ -70,8 +98,14 @@ class PlotArtist:
         index = pd.DatetimeIndex(self.allowed_x, name=self.time_col)
         self.df = pd.DataFrame(index=index)
 
-        # A list of (x, y) points that have been drawn for the current series
-        self.points: list[Point] = []
+        # The y values of each finished series, added to the DataFrame in one batch when saving
+        self._series_data: dict[str, np.ndarray] = {}
+
+        # The (x, y) points that have been drawn for the current series, stored as parallel arrays of
+        # nanosecond timestamps and values. At most one point can be drawn per allowed x coordinate.
+        self._xs = np.empty(len(self.allowed_x), dtype=np.int64)
+        self._ys = np.empty(len(self.allowed_x), dtype=np.float64)
+        self._n = 0
 
         # The current series's most recent x coordinate (future points must be greater than this)
         self.current_x = None
@@ -79,6 +113,14 @@ class PlotArtist:
         # Colors for the series
         self.colors = ["blue", "green", "cyan", "purple", "orange", "brown", "pink", "gray", "olive"]
 
+        # One legend entry per series, extended as each new series is started
+        self._legend_patches: list[mpatches.Patch] = []
+
+        # Snapshot of the rendered axes and the artists added since, so clicks can be blitted
+        # instead of redrawing the whole canvas (including every vertical line) each time
+        self._bg = None
+        self._new_artists: list[Artist] = []
+
         # Initialize plot
         self.figure, self.ax = plt.subplots()
         self.initialize_plot()
@@ -90,7 +132,14 @@ class PlotArtist:
         self.ax.set_ylim(self.y_min, self.y_max)
         self.ax.set_xlabel(f"{self.time_col} {'(' + str(self.tz) +')' if self.tz else ''}")
         self.ax.set_ylabel("Value")
+
+        # The limits are fixed, so skip autoscaling every time a line is added
+        self.ax.set_autoscale_on(False)
+        self.ax.use_sticky_edges = False
+
         self.draw_vertical_lines()
+        self.figure.canvas.mpl_connect("draw_event", self.on_draw)
+        self.figure.canvas.draw()
 
     def format_x_axis_times(self):
         """Handle the date formatting for x axis."""
@@ -99,53 +148,48 @@ class PlotArtist:
 
         # Determine whether to include month or day based on the range of the time period
         if month_range > 1:
-            date_component = "%m-%d"
+            range_bucket = "months"
         elif day_range > 1:
-            date_component = "-%d"
+            range_bucket = "days"
         else:
-            date_component = ""
+            range_bucket = "hours"
 
         # Determine granularity of time component based on period
-        time_component = "%H"
-        if self.period < pd.Timedelta("1min"):
-            time_component += "%M:%S"
-        elif self.period < pd.Timedelta("1h"):
-            time_component = "%M"
+        if self.period < _ONE_MIN:
+            period_bucket = "seconds"
+        elif self.period < _ONE_HOUR:
+            period_bucket = "minutes"
+        else:
+            period_bucket = "hours"
 
         # Apply the formatting to the x axis
-        xfmt = mdates.AutoDateFormatter(date_component + " " + time_component)
+        xfmt = mdates.DateFormatter(_FMT_TABLE[(range_bucket, period_bucket)], tz=self.tz)
         self.ax.xaxis.set_major_formatter(xfmt)
         plt.xticks(rotation=45)
 
     def start_loop(self):
         """Start an open-ended loop to draw multiple time series."""
-        self.draw_series()
-        if ask_user("Draw another series? [y/n]: "):
+        while True:
+            self.draw_series()
+            if not ask_user("Draw another series? [y/n]: "):
+                break
             if ask_user("Change Y range? [y/n]: "):
                 self.y_min = float(get_response("Enter new Y min: "))
                 self.y_max = float(get_response("Enter new Y max: "))
                 self.ax.set_ylim(self.y_min, self.y_max)
                 self.figure.canvas.draw()
-            return self.start_loop()
         self.prompt_save_data()
 
     def draw_series(self):
         """Start drawing a single time series until it's complete."""
         name = get_response("Enter Series Name: ", allow_empty=False)
-        cur_points = len(self.points)
         self.add_to_legend(name)
 
-        while True:
-            continue_loop = self.add_points()
-            for p in self.points[cur_points:]:
-                x, y = p
-                assert isinstance(x, pd.Timestamp) and isinstance(y, float)
-            if not continue_loop:
-                break
-            cur_points = len(self.points)
+        while self.add_points():
+            pass
 
-        # Remove duplicate points and sort by x coordinate
-        self.points = sorted(list(set(self.points)), key=lambda point: point.x)
+        # Points are already sorted and unique, since each one must be after the current x coordinate
+        assert np.all(np.diff(self._xs[: self._n]) > 0)
         valid = self.verify_points()
         if not valid:
             print("Received invalid points")
@@ -153,23 +197,33 @@ class PlotArtist:
 
     def add_to_legend(self, new_series_name: str):
         """Add an entry for the new series to the legend."""
-        existing_cols = list(self.df.columns) if len(self.df.columns) else []
-        columns = existing_cols + [new_series_name]
-        colors = self.colors[: len(columns)]
-        patches = [mpatches.Patch(color=color, label=col) for color, col in zip(colors, columns)]
-        self.ax.legend(handles=patches, loc="upper right")
+        self._legend_patches.append(mpatches.Patch(color=self.color, label=new_series_name))
+        self.ax.legend(handles=self._legend_patches, loc="upper right")
+
+        # The legend is part of the background, so it must be rendered again
+        self._bg = None
 
     def finish_series(self, name: str):
-        """When all points for a series have been drawn, add it to the DataFrame and reset."""
-        self.df[name] = [p.y for p in self.points]
-        self.points.clear()
+        """When all points for a series have been drawn, store its values and reset."""
+        # The DataFrame is only built when saving, so reject incomplete series here rather than broadcasting
+        if self._n != len(self.df.index):
+            raise ValueError(
+                f"Length of values ({self._n}) does not match length of index ({len(self.df.index)})"
+            )
+
+        # Copy the values since the point arrays are reused for the next series
+        self._series_data[name] = self._ys[: self._n].copy()
+        self._n = 0
         self.current_x = None
 
+        # Render the completed series into the background used for blitting
+        self._bg = None
+
     def prompt_save_data(self):
         """Prompt the user to save the data to a csv file."""
-        # Add constant columns to the DataFrame
-        for constant_col, value in self.constants.items():
-            self.df[constant_col] = value
+        # Add every series and constant column to the DataFrame at once to avoid fragmenting it
+        extra = pd.DataFrame(self._series_data, index=self.df.index).assign(**self.constants)
+        self.df = pd.concat([self.df, extra], axis=1)
 
         if ask_user("Save data in wide format (one column per series)? [y/n]: "):
             save_path = Path(
@@ -188,8 +242,9 @@ class PlotArtist:
 
     def draw_vertical_lines(self):
         """Add semi-transparent vertical lines at each period."""
-        for x in self.allowed_x:
-            self.ax.axvline(x=x, color="red", linewidth=1, alpha=0.6)
+        # Draw every line as one collection spanning the full height of the axes (like axvline)
+        transform = self.ax.get_xaxis_transform()
+        self.ax.vlines(self.allowed_x, 0, 1, colors="red", linewidths=1, alpha=0.6, transform=transform)
         plt.draw()
 
     def add_points(self) -> bool:
@@ -199,11 +254,11 @@ class PlotArtist:
             Whether to keep running the loop.
             i.e. True if there are remaining points, False if all points are drawn
         """
-        xys = plt.ginput()
-        if len(xys) == 0:
+        click = self.wait_for_click()
+        if click is None:
             return False
 
-        x_sel, y = xys[0]
+        x_sel, y = click
         target_x = self.get_target_x_coord(x_sel)
         if target_x is None:
             return True
@@ -211,6 +266,46 @@ class PlotArtist:
         self.plot_selection(target_x, y)
         return self.current_x != self.allowed_x[-1]
 
+    def wait_for_click(self, timeout: float = 30) -> Optional[tuple[float, float]]:
+        """Block until the user selects a point on the axes.
+
+        This accepts the same input as plt.ginput(n=1): a left click or key press adds a point, while a
+        middle click, the enter or escape key, or the timeout stops the series. A right click, backspace or
+        delete is ignored. Unlike ginput it does not redraw the whole canvas afterwards, which would defeat
+        blitting the new lines.
+
+        Args:
+            timeout: How many seconds to wait for input before stopping (non-positive waits forever)
+
+        Returns:
+            The (x, y) data coordinates of the selection, or None if the user stopped
+        """
+        canvas = self.figure.canvas
+        clicks = []
+
+        def on_event(event):
+            is_button = event.name == "button_press_event"
+            button = event.button if is_button else None
+            key = None if is_button else event.key
+            if button == MouseButton.MIDDLE or key in ["escape", "enter"]:
+                canvas.stop_event_loop()
+            elif button == MouseButton.RIGHT or key in ["backspace", "delete"]:
+                # ginput uses these to undo a pending point, but a single selection never has one
+                return
+            elif (button == MouseButton.LEFT or key is not None) and event.inaxes is self.ax:
+                clicks.append((event.xdata, event.ydata))
+                canvas.stop_event_loop()
+
+        if canvas.manager:
+            self.figure.show()
+        cids = [canvas.mpl_connect(name, on_event) for name in ["button_press_event", "key_press_event"]]
+        try:
+            canvas.start_event_loop(timeout)
+        finally:
+            for cid in cids:
+                canvas.mpl_disconnect(cid)
+        return clicks[0] if clicks else None
+
     def get_target_x_coord(self, x_sel: float) -> Optional[pd.Timestamp]:
         """In response to a user's click, determine the snapped x coordinate.
 
@@ -220,31 +315,21 @@ class PlotArtist:
         Returns:
             The closest allowed x-coordinate to the user's click
         """
-        # Take advantage of the fact that allowed_x is sorted
+        # Take advantage of the fact that allowed_x is a sorted, regular grid
         if self.current_x is None:
             # For the first point, always start as the first allowed coordinate
-            target_x = self.allowed_x[0]
-        else:
-            # If the x axis is a date, x_sel is in hours since epoch
-            x_to_seconds = x_sel * 60 * 60 * 24
-            time_struct = time.gmtime(x_to_seconds)
-            x_pd = pd.Timestamp(
-                year=time_struct.tm_year,
-                month=time_struct.tm_mon,
-                day=time_struct.tm_mday,
-                hour=time_struct.tm_hour,
-                minute=time_struct.tm_min,
-                second=time_struct.tm_sec,
-                tz=self.tz,
-            )
-            x_ordered = sorted(
-                [x for x in self.allowed_x if x > self.current_x],
-                key=lambda x: abs(x - x_pd),
-            )
-            if len(x_ordered) == 0:
-                return None
-            target_x = x_ordered[0]
-        return target_x
+            return self.allowed_x[0]
+
+        # Future points must come after the current x coordinate
+        min_idx = self._grid_index(self.current_x) + 1
+        if min_idx >= len(self._allowed_i8):
+            return None
+
+        # x_sel is in days since the matplotlib epoch, so round it to the nearest period in nanoseconds
+        x_ns = self._grid_ns(pd.Timestamp(mdates.num2date(x_sel, tz=self.tz)))
+        idx = (x_ns - self._allowed_i8[0] + self._period_ns // 2) // self._period_ns
+        idx = min(max(idx, min_idx), len(self._allowed_i8) - 1)
+        return self.allowed_x[idx]
 
     def plot_selection(
         self,
@@ -259,57 +344,86 @@ class PlotArtist:
             y: The y coordinate where the user clicked
         """
         # Where should the line start from
-        prev_x, prev_y = self.points[-1] if len(self.points) else (None, None)
+        prev_x, prev_y = (self.current_x, self._ys[self._n - 1]) if self._n else (None, None)
 
-        # If the x coordinate is greater than the current x coordinate, interpolate the points
+        # If there are allowed x coordinates between the previous and the new one, interpolate the points
         if (
             prev_x is not None
             and prev_y is not None
-            and self.current_x is not None
-            and x_snapped > (self.current_x + self.period)
+            and self._grid_index(x_snapped) > self._grid_index(prev_x) + 1
         ):
-            delta = x_snapped - prev_x
-            if isinstance(x_snapped, pd.Timestamp):
-                delta = (x_snapped - prev_x).total_seconds() / 60
-            slope = (y - prev_y) / delta
-
-            for x_intermediate in pd.date_range(
-                self.current_x + self.period, x_snapped, freq=self.period, inclusive="left"
-            ):
-                delta = prev_x - x_intermediate
-                if isinstance(x_snapped, pd.Timestamp):
-                    delta = (prev_x - x_intermediate).total_seconds() / 60
-                y_intermediate = prev_y - slope * delta
-                self.points.append(Point(x_intermediate, y_intermediate))
-                self.plot_point(x_intermediate, y_intermediate)
+            # Slope in value per minute (x coordinates are always Timestamps from allowed_x)
+            slope = (y - prev_y) / ((x_snapped.value - prev_x.value) / 60e9)
+
+            # Interpolate all the intermediate points at once, measuring minutes from the previous point
+            xs = self.allowed_x[self._grid_index(prev_x) + 1 : self._grid_index(x_snapped)]
+            ys = prev_y + slope * (xs.asi8 - prev_x.value) / 60e9
+            self._xs[self._n : self._n + len(xs)] = xs.asi8
+            self._ys[self._n : self._n + len(xs)] = ys
+            self._n += len(xs)
+            self._new_artists += self.ax.plot(xs, ys, marker="o", linestyle="none", color=self.color)
 
         # Add the final point and line
-        self.plot_point(x_snapped, y)
+        self._new_artists.append(self.plot_point(x_snapped, y))
         if prev_x is not None and prev_y is not None:
-            self.ax.plot([prev_x, x_snapped], [prev_y, y], color=self.color, linewidth=2)
-        self.points.append(Point(x_snapped, y))
+            self._new_artists += self.ax.plot([prev_x, x_snapped], [prev_y, y], color=self.color, linewidth=2)
+        self._xs[self._n] = x_snapped.value
+        self._ys[self._n] = y
+        self._n += 1
         self.current_x = x_snapped
 
         # Update the plot with the new lines
-        self.figure.canvas.draw()
+        self.update_canvas()
 
-    def plot_point(self, x, y):
+    def plot_point(self, x, y) -> Line2D:
         """Add a single point to the plot."""
-        self.ax.plot(x, y, marker="o", color=self.color, linewidth=5)
+        return self.ax.plot(x, y, marker="o", color=self.color, linewidth=5)[0]
+
+    def update_canvas(self):
+        """Show the newly added artists by blitting them on top of the cached background."""
+        canvas = self.figure.canvas
+        if not canvas.supports_blit:
+            canvas.draw_idle()
+            return
+        if self._bg is None:
+            # A full draw refreshes the background through on_draw
+            canvas.draw()
+            return
+
+        canvas.restore_region(self._bg)
+        for artist in self._new_artists:
+            self.ax.draw_artist(artist)
+        canvas.blit(self.ax.bbox)
+
+        # The blitted artists become part of the background for the next click
+        self._bg = canvas.copy_from_bbox(self.ax.bbox)
+        self._new_artists.clear()
+
+    def on_draw(self, event):
+        """After a full draw of the canvas, cache the rendered axes as the background for blitting."""
+        self._bg = self.figure.canvas.copy_from_bbox(self.ax.bbox)
+        self._new_artists.clear()
 
     def verify_points(self):
         """Validate that the final list of points are all on valid x coordinates."""
-        if len(self.points) != len(self.allowed_x):
+        if self._n != len(self.allowed_x):
             return False
-        for p in self.points:
-            if p[0] not in self.allowed_x:
-                return False
-        return True
+
+        # The points are sorted and unique, so they are valid only if they are exactly the allowed x
+        return bool(np.array_equal(self._xs[: self._n], self.allowed_x.asi8))
+
+    def _grid_ns(self, ts: pd.Timestamp) -> int:
+        """Convert a timestamp to nanoseconds on the same scale as the allowed x grid."""
+        return ts.tz_localize(None).value if self._wall_clock_grid else ts.value
+
+    def _grid_index(self, ts: pd.Timestamp) -> int:
+        """Find the index of an allowed x coordinate from its position on the grid."""
+        return (self._grid_ns(ts) - self._allowed_i8[0]) // self._period_ns
 
     @property
     def series_idx(self):
         """The zero-based index of the current series."""
-        return len(self.df.columns)
+        return len(self._series_data)
 
     @property
     def color(self):
@@ -1,6 +1,8 @@
 """Entry point for the mock data generator CLI application."""
 
 import argparse
+import functools
+from typing import Union
 
 import pandas as pd
 
@@ -56,18 +58,30 @@ def prompt_user_for_args(args) -> argparse.Namespace:
     return coerce_arg_types(args)
 
 
+@functools.lru_cache(maxsize=128)
+def _to_ts(value: Union[str, pd.Timestamp], tz: str) -> pd.Timestamp:
+    """Convert a start or end argument to a timestamp in the given timezone."""
+    return pd.Timestamp(value, tz=tz)
+
+
+@functools.lru_cache(maxsize=128)
+def _to_td(value: Union[str, pd.Timedelta]) -> pd.Timedelta:
+    """Convert a period argument to a timedelta."""
+    return pd.Timedelta(value)
+
+
 def coerce_arg_types(args: argparse.Namespace) -> argparse.Namespace:
     """Take a Namespace object with all arguments and coerce them to the right types."""
     try:
-        args.start = pd.Timestamp(args.start, tz=args.timezone)
+        args.start = _to_ts(args.start, args.timezone)
     except ValueError:
         raise ValueError("args.start must be convertable to pd.Timestamp")
     try:
-        args.end = pd.Timestamp(args.end, tz=args.timezone)
+        args.end = _to_ts(args.end, args.timezone)
     except ValueError:
         raise ValueError("args.end must be convertable to pd.Timestamp")
     try:
-        args.period = pd.Timedelta(args.period)
+        args.period = _to_td(args.period)
     except ValueError:
         raise ValueError("args.period must be convertable to pd.Timedelta")
     try:
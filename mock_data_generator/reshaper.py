@@ -128,18 +128,24 @@ def reshape(
         # Append the result to the list
         melted_dfs.append(melted_set)
 
-    # Merge all the melted dataframes on the identifier column and time
-    final_melted_df = melted_dfs[0]
-    if len(melted_dfs) > 1:
+    # Align all the melted dataframes on the identifier column and time in a single concat. Concat can
+    # only align unique keys, so fall back to merging if a set repeats a key (e.g. a duplicated timestamp
+    # in the CSV, or several columns mapped to the same identifier).
+    join_cols = [time_col, grouping_col]
+    indexed_dfs = [m.set_index(join_cols) for m in melted_dfs]
+    if all(m.index.is_unique for m in indexed_dfs):
+        final_melted_df = pd.concat(indexed_dfs, axis=1).reset_index()
+    else:
+        final_melted_df = melted_dfs[0]
         for merge_df in melted_dfs[1:]:
-            final_melted_df = final_melted_df.merge(merge_df, on=[time_col, grouping_col], how="outer")
+            final_melted_df = final_melted_df.merge(merge_df, on=join_cols, how="outer")
 
-    # Sort the DataFrame by the time column
-    final_melted_df = final_melted_df.sort_values(by=time_col)
+    # Sort the DataFrame by the time column, keeping rows at the same time in the order they were unpivoted
+    final_melted_df = final_melted_df.sort_values(by=time_col, kind="stable")
 
-    # Add constants to the DataFrame
-    for constant_col, value in constants.items():
-        final_melted_df[constant_col] = value
+    # Add constants to the DataFrame in a single pass
+    if constants:
+        final_melted_df = final_melted_df.assign(**constants)
 
     return final_melted_df
 
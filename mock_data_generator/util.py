@@ -23,13 +23,11 @@ def get_response(
         condition: A function that takes the response and returns whether it is valid.
                    If the condition is not met, the user will be prompted again.
     """
-    initial_response = _get_response(prompt, default, allow_empty)
-    if condition is None:
-        return initial_response
-    if condition(initial_response):
-        return initial_response
-    print("Response did not meet conditions.  Please try again...")
-    return get_response(prompt, default, allow_empty, condition)
+    while True:
+        response = _get_response(prompt, default, allow_empty)
+        if condition is None or condition(response):
+            return response
+        print("Response did not meet conditions.  Please try again...")
 
 
 def _get_response(
@@ -37,12 +35,12 @@ def _get_response(
     default: str = "",
     allow_empty: bool = True,
 ):
-    response = input(prompt)
-    if response:
-        return response
-    if default:
-        return default
-    if not allow_empty:
+    while True:
+        response = input(prompt)
+        if response:
+            return response
+        if default:
+            return default
+        if allow_empty:
+            return ""
         print("You must provide a response to this prompt!")
-        return get_response(prompt, default, allow_empty)
-    return ""